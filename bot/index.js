@@ -72,6 +72,11 @@ async function uploadToS3({ fileName, fileContent, contentType = 'text/plain' })
   return s3.upload(params).promise();
 }
 
+async function downloadFromS3(fileName) {
+  const { Body } = await s3.getObject({ Bucket: 'simpleflowdata', Key: fileName }).promise();
+  return Body.toString('utf8');
+}
+
 /**
  * This is the main entrypoint to your Probot app
  * @param {import('probot').Probot} app
@@ -261,9 +266,11 @@ module.exports = (app) => {
 
           // Send file to API Gateway for documentation generation
           logger.info(`Generating documentation for: ${filePath}`);
-          const documentedContent = await documentationInvoker({
+          const documentation = await documentationInvoker({
             file_id: uniqueFileNameForDocs
           });
+          // The documented file is written to S3 by the Lambda, only its key comes back through API Gateway
+          const documentedContent = await downloadFromS3(documentation.key);
           logger.info(`Documentation generation completed for: ${filePath}`);
           logger.info(`Documentation generation : ${documentedContent}`);
 
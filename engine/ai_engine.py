@@ -1,6 +1,11 @@
 import json
+import logging
+import os
 import boto3
 
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
 def doc_generator(id):
     s3_bucket_name = "simpleflowdata"
     model_id = "anthropic.claude-3-haiku-20240307-v1:0"
@@ -16,10 +21,10 @@ def doc_generator(id):
         s3_object = s3_client.get_object(Bucket=s3_bucket_name, Key=id)
         file_content = s3_object["Body"].read().decode("utf-8")
     except Exception as e:
-        print(f"Erreur lors de la lecture du fichier S3 : {e}")
+        logger.error(f"Erreur lors de la lecture du fichier S3 : {e}")
         exit()
 
-    print(file_content)
+    logger.debug("file read from S3: %d chars", len(file_content))
 
     prompt = f"""
     Act as an expert software developer from Amazon. Your task is to add comprehensive comments to the following code, adhering to Amazon's internal documentation standards and best practices for the specific programming language.
@@ -53,7 +58,7 @@ def doc_generator(id):
         return model_commentary
 
     except Exception as e:
-        print(f"Erreur lors de l'appel à Bedrock : {e}")
+        logger.error(f"Erreur lors de l'appel à Bedrock : {e}")
 
 def lambda_handler(event, context):
     body = json.loads(event['body'])
@@ -0,0 +1,93 @@
+import os
+import requests
+import torch
+from optimum.onnxruntime import ORTModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, StaticCache
+
+model_id = "deepseek-ai/deepseek-coder-1.3b-instruct"
+# GPTQ kernels only exist on CUDA: the 4-bit checkpoint reads a quarter of the fp16 weight bytes per decoded token
+gptq_model_id = "TheBloke/deepseek-coder-1.3b-instruct-GPTQ"
+# int8 ONNX export written by export_onnx.py: ONNX Runtime fuses the ops and runs int8 GEMMs on CPU
+onnx_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "deepseek-coder-1.3b-instruct-onnx")
+use_onnx = not torch.cuda.is_available()
+max_cache_len = 4096
+
+# When several processes need the model, start one OpenAI-compatible server and point them at it instead of loading it in each:
+# python -m vllm.entrypoints.openai.api_server --model deepseek-ai/deepseek-coder-1.3b-instruct --dtype=auto
+server_url = os.environ.get("DEEPSEEK_SERVER_URL")
+
+_tokenizer = None
+_model = None
+_prefixes = {}
+_cache = None
+
+def get_tokenizer():
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = AutoTokenizer.from_pretrained(model_id, trust_remote_code=True)
+    return _tokenizer
+
+def get_model():
+    global _model
+    if _model is None:
+        if use_onnx:
+            if not os.path.isdir(onnx_dir):
+                raise FileNotFoundError(f"ONNX export not found at {onnx_dir}, run export_onnx.py first")
+            _model = ORTModelForCausalLM.from_pretrained(onnx_dir, file_name="model_quantized.onnx", use_cache=True, provider="CPUExecutionProvider")
+        else:
+            _model = AutoModelForCausalLM.from_pretrained(gptq_model_id, torch_dtype=torch.float16, device_map="auto", attn_implementation="sdpa", trust_remote_code=True)
+            _model.forward = torch.compile(_model.forward, mode="reduce-overhead", fullgraph=True)
+    return _model
+
+def _get_prefix(instruction):
+    # The chat template and the instruction never change: tokenize them and prefill their KV once, only the code is processed per call
+    if instruction not in _prefixes:
+        tokenizer, model = get_tokenizer(), get_model()
+        prompt_prefix, prompt_suffix = tokenizer.apply_chat_template([{'role': 'user', 'content': instruction + "{code}"}], add_generation_prompt=True, tokenize=False).split("{code}")
+        prefix_ids = tokenizer(prompt_prefix, add_special_tokens=False, return_tensors="pt").input_ids.to(model.device)
+        prefix_cache = None
+        if not use_onnx:
+            prefix_cache = StaticCache(config=model.config, max_batch_size=1, max_cache_len=max_cache_len, device=model.device, dtype=model.dtype)
+            # An explicit cache_position keeps the compiled forward from deriving it from the cache contents, which fullgraph cannot trace
+            with torch.no_grad():
+                prefix_cache = model(prefix_ids, past_key_values=prefix_cache, cache_position=torch.arange(prefix_ids.shape[-1], device=model.device)).past_key_values
+        _prefixes[instruction] = (prefix_ids, prompt_suffix, prefix_cache)
+    return _prefixes[instruction]
+
+def _load_prefix_cache(prefix_cache):
+    # The CUDA graphs recorded by reduce-overhead are bound to the KV tensor addresses: reuse one working cache and overwrite it in place
+    global _cache
+    if prefix_cache is None:
+        return None
+    if _cache is None:
+        model = get_model()
+        _cache = StaticCache(config=model.config, max_batch_size=1, max_cache_len=max_cache_len, device=model.device, dtype=model.dtype)
+    for layer, prefix_layer in zip(_cache.layers, prefix_cache.layers):
+        layer.keys.copy_(prefix_layer.keys)
+        layer.values.copy_(prefix_layer.values)
+    return _cache
+
+def generate(instruction, code, max_new_tokens=512):
+    if server_url:
+        response = requests.post(
+            f"{server_url.rstrip('/')}/v1/chat/completions",
+            json={
+                "model": model_id,
+                "messages": [{'role': 'user', 'content': instruction + code}],
+                "max_tokens": max_new_tokens,
+                "temperature": 0,
+            },
+            timeout=600,
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+    tokenizer, model = get_tokenizer(), get_model()
+    prefix_ids, prompt_suffix, prefix_cache = _get_prefix(instruction)
+    code_ids = tokenizer(code + prompt_suffix, add_special_tokens=False, return_tensors="pt").input_ids.to(model.device)
+    inputs = torch.cat([prefix_ids, code_ids], dim=-1)
+    # Writing past the end of the StaticCache trips a device-side assert that leaves the CUDA context unusable
+    if prefix_cache is not None and inputs.shape[-1] + max_new_tokens > max_cache_len:
+        raise ValueError(f"prompt of {inputs.shape[-1]} tokens plus max_new_tokens={max_new_tokens} exceeds max_cache_len={max_cache_len}")
+    outputs = model.generate(inputs, max_new_tokens=max_new_tokens, do_sample=False, num_return_sequences=1, eos_token_id=tokenizer.eos_token_id, past_key_values=_load_prefix_cache(prefix_cache), use_cache=True)
+    return tokenizer.decode(outputs[0][len(inputs[0]):], skip_special_tokens=True)
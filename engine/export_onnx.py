@@ -0,0 +1,9 @@
+from optimum.onnxruntime import ORTModelForCausalLM, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from deepseek_model import model_id, onnx_dir
+
+# Run once before serving on CPU: exports deepseek-coder with its KV-cache inputs to ONNX, then quantizes the weights to
+# int8 with dynamic activation ranges. deepseek_model.get_model() loads the result from onnx_dir.
+model = ORTModelForCausalLM.from_pretrained(model_id, export=True, use_cache=True, provider="CPUExecutionProvider")
+quantizer = ORTQuantizer.from_pretrained(model)
+quantizer.quantize(save_dir=onnx_dir, quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=False))
@@ -1,11 +1,14 @@
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM, BitsAndBytesConfig
+from transformers import AutoTokenizer, AutoModelForCausalLM, BitsAndBytesConfig, StaticCache
 
-quantization_config = BitsAndBytesConfig(
-    load_in_4bit=True,
-    bnb_4bit_quant_type="nf4",
-    bnb_4bit_compute_dtype=torch.bfloat16
-)
+# Le NF4 de bitsandbytes n'a de noyau que sur CUDA : sur CPU chaque matmul repasse par une déquantification en bf16
+quantization_config = None
+if torch.cuda.is_available():
+    quantization_config = BitsAndBytesConfig(
+        load_in_4bit=True,
+        bnb_4bit_quant_type="nf4",
+        bnb_4bit_compute_dtype=torch.bfloat16
+    )
 
 # --- 2. CHARGEMENT DU MODÈLE ET DU TOKENIZER ---
 model_id = "codellama/CodeLlama-7b-Instruct-hf"
@@ -13,11 +16,12 @@ model_id = "codellama/CodeLlama-7b-Instruct-hf"
 print(f"Chargement du tokenizer pour {model_id}...")
 tokenizer = AutoTokenizer.from_pretrained(model_id)
 
-print("Chargement du modèle avec la configuration 4-bit correcte...")
+print(f"Chargement du modèle ({'4-bit CUDA' if quantization_config else 'bf16 CPU'})...")
 model = AutoModelForCausalLM.from_pretrained(
     model_id,
     quantization_config=quantization_config,
-    device_map="cpu" 
+    torch_dtype=torch.bfloat16,
+    device_map="auto"
 )
 print("Modèle chargé avec succès.")
 
@@ -43,11 +47,17 @@ formatted_prompt = f"<s>[INST] {instruction}\n\n```python\n{code_a_documenter}\n
 print("\nGénération de la documentation en cours (cela peut prendre plusieurs minutes)...")
 inputs = tokenizer(formatted_prompt, return_tensors="pt").to(model.device)
 
+max_new_tokens = 150
+cache = StaticCache(config=model.config, max_batch_size=1, max_cache_len=inputs.input_ids.shape[-1] + max_new_tokens, device=model.device, dtype=torch.bfloat16)
+
+# Décodage glouton : une docstring n'a pas besoin d'échantillonnage, et l'argmax seul reste compatible avec la capture en graphe
 output = model.generate(
     **inputs,
-    max_new_tokens=150,
-    temperature=0.2,
-    do_sample=True
+    max_new_tokens=max_new_tokens,
+    do_sample=False,
+    num_beams=1,
+    past_key_values=cache,
+    use_cache=True
 )
 
 response_tokens = output[0][inputs.input_ids.shape[-1]:]
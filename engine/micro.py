@@ -1,11 +1,23 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer
+import torch
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
 
 model_name = "microsoft/NextCoder-7B"
 
+# bitsandbytes 4-bit kernels are CUDA-only, on CPU they would dequantize every matmul back to bf16
+quantization_config = None
+if torch.cuda.is_available():
+    quantization_config = BitsAndBytesConfig(
+        load_in_4bit=True,
+        bnb_4bit_quant_type="nf4",
+        bnb_4bit_compute_dtype=torch.bfloat16
+    )
+
 model = AutoModelForCausalLM.from_pretrained(
     model_name,
     torch_dtype="auto",
     device_map="auto",
+    attn_implementation="sdpa",
+    quantization_config=quantization_config,
 )
 tokenizer = AutoTokenizer.from_pretrained(model_name)
 
@@ -0,0 +1,10 @@
+# Run once while building the engine image, with TORCHINDUCTOR_CACHE_DIR set in the image environment
+# (e.g. ENV TORCHINDUCTOR_CACHE_DIR=/opt/torch_compile_cache): a short dummy generation per instruction
+# makes TorchInductor write its kernels there. Bake that directory into the image layer so later processes
+# reuse the kernels already built; prompt shapes not exercised here still compile on first use.
+import comment_generator
+import file_overview
+from deepseek_model import generate
+
+for instruction in (comment_generator.instruction, file_overview.instruction):
+    generate(instruction, "int main(void) { return 0; }", max_new_tokens=16)
@@ -1,14 +1,26 @@
 import json
+import logging
+import os
 import boto3
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+# Built once per container: warm invocations reuse the client and its keep-alive connection to Bedrock
+bedrock_runtime_client = boto3.client(
+    service_name="bedrock-runtime",
+    region_name="eu-west-3",
+    config=Config(tcp_keepalive=True, retries={"max_attempts": 2})
+)
+
+# A title is a single line and a rewritten issue stays well under 2048 tokens
+ISSUE_MAX_TOKENS = 2048
+TITLE_MAX_TOKENS = 64
 
 def issue_rewriter(issue_content, comment):
     model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-    aws_region = "eu-west-3"
-
-    bedrock_runtime_client = boto3.client(
-        service_name="bedrock-runtime", 
-        region_name=aws_region
-    )
 
     prompt = f"""
     You are a senior product manager at a tech company.  
@@ -26,73 +38,58 @@ def issue_rewriter(issue_content, comment):
     FeedbackOfInput: {comment}
     """
 
-    request_body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4096,
-        "messages": [
-            {
-                "role": "user",
-                "content": [{"type": "text", "text": prompt}],
-            }
-        ],
-    }
+    messages = [
+        {
+            "role": "user",
+            "content": [{"text": prompt}],
+        }
+    ]
 
     try:
-        response = bedrock_runtime_client.invoke_model(
+        response = bedrock_runtime_client.converse(
             modelId=model_id,
-            body=json.dumps(request_body),
+            messages=messages,
+            inferenceConfig={"maxTokens": ISSUE_MAX_TOKENS},
         )
 
-        response_body = json.loads(response.get("body").read())
-        
-        model_commentary = response_body["content"][0]["text"]
+        model_commentary = response["output"]["message"]["content"][0]["text"]
         return model_commentary
 
     except Exception as e:
-        print(f"Erreur lors de l'appel à Bedrock : {e}")
+        logger.error(f"Erreur lors de l'appel à Bedrock : {e}")
 
-def issue_title_generator(issue_content):
+def issue_title_generator(issue_content, comment):
     model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-    aws_region = "eu-west-3"
-
-    bedrock_runtime_client = boto3.client(
-        service_name="bedrock-runtime", 
-        region_name=aws_region
-    )
 
     prompt = f"""
     You are a senior product manager. 
     Your task is to generate a clear, concise, and professional GitHub issue title. 
-    The title should summarize the content of the issue in one short sentence. 
+    The title should summarize the content of the issue in one short sentence, once the feedback of the developer has been applied to it. 
     Do not return anything except the title itself (no description, no formatting).  
     
     Input: {issue_content}
+    FeedbackOfInput: {comment}
     """
 
-    request_body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4096,
-        "messages": [
-            {
-                "role": "user",
-                "content": [{"type": "text", "text": prompt}],
-            }
-        ],
-    }
+    messages = [
+        {
+            "role": "user",
+            "content": [{"text": prompt}],
+        }
+    ]
 
     try:
-        response = bedrock_runtime_client.invoke_model(
+        response = bedrock_runtime_client.converse(
             modelId=model_id,
-            body=json.dumps(request_body),
+            messages=messages,
+            inferenceConfig={"maxTokens": TITLE_MAX_TOKENS, "stopSequences": ["\n\n"]},
         )
 
-        response_body = json.loads(response.get("body").read())
-        
-        model_commentary = response_body["content"][0]["text"]
+        model_commentary = response["output"]["message"]["content"][0]["text"]
         return model_commentary
 
     except Exception as e:
-        print(f"Erreur lors de l'appel à Bedrock : {e}")
+        logger.error(f"Erreur lors de l'appel à Bedrock : {e}")
 
 def lambda_handler(event, context):
     body = json.loads(event['body'])
@@ -102,11 +99,22 @@ def lambda_handler(event, context):
             'body': "not found"
         }
 
-    issue_body = issue_rewriter(body['issue_content'], body['issue_comment'])
+    # The title is generated from the same input as the body, so both Bedrock calls run concurrently on the shared client
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        issue_body = executor.submit(issue_rewriter, body['issue_content'], body['issue_comment'])
+        issue_title = executor.submit(issue_title_generator, body['issue_content'], body['issue_comment'])
+
+    title, issue = issue_title.result(), issue_body.result()
+    if title is None or issue is None:
+        return {
+            'statusCode': 500,
+            'body': json.dumps({'error': "issue generation failed"})
+        }
+
     return {
         'statusCode': 200,
         'body': {
-            'title': issue_title_generator(issue_body), 
-            'body': issue_body
+            'title': title,
+            'body': issue
         }
     }
@@ -1,96 +1,67 @@
 import json
+import logging
+import os
 import boto3
+from botocore.config import Config
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+# Built once per container: warm invocations reuse the client and its keep-alive connection to Bedrock
+bedrock_runtime_client = boto3.client(
+    service_name="bedrock-runtime",
+    region_name="eu-west-3",
+    config=Config(tcp_keepalive=True, retries={"max_attempts": 2})
+)
+
+# A title plus an issue body stays well under this output budget
+ISSUE_MAX_TOKENS = 2048
 
 def issue_writer(content):
     model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-    aws_region = "eu-west-3"
-
-    bedrock_runtime_client = boto3.client(
-        service_name="bedrock-runtime", 
-        region_name=aws_region
-    )
 
     prompt = f"""
-    You are a senior product manager at a tech company.  
-    Your task is to generate a GitHub issue in Markdown format based on the provided input.  
+    You are a senior product manager at a tech company.
+    Your task is to generate a GitHub issue based on the provided input.
 
-    The issue must include:  
-    - A clear and concise **title** starting with an emoji.  
-    - A **description** explaining the feature, user need, or problem.  
-    - A list of **acceptance criteria** in checklist format (`- [ ]`).  
+    Return JSON with keys title and body:
+    - title: a clear, concise, and professional title starting with an emoji, summarizing the issue in one short sentence, without any Markdown formatting.
+    - body: the issue in Markdown, including a **description** explaining the feature, user need, or problem, and a list of **acceptance criteria** in checklist format (`- [ ]`).
 
-    Tone: professional, precise, and action-oriented.  
-    Output: Return only the issue in Markdown, do not wrap it in triple backticks.
+    Tone: professional, precise, and action-oriented.
+    Output: Return only the JSON object, do not wrap it in triple backticks and do not add any other text.
     Input: {content}
     """
 
-    request_body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4096,
-        "messages": [
-            {
-                "role": "user",
-                "content": [{"type": "text", "text": prompt}],
-            }
-        ],
-    }
-
-    try:
-        response = bedrock_runtime_client.invoke_model(
-            modelId=model_id,
-            body=json.dumps(request_body),
-        )
-
-        response_body = json.loads(response.get("body").read())
-        
-        model_commentary = response_body["content"][0]["text"]
-        return model_commentary
-
-    except Exception as e:
-        print(f"Erreur lors de l'appel à Bedrock : {e}")
-
-def issue_title_generator(issue_content):
-    model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-    aws_region = "eu-west-3"
-
-    bedrock_runtime_client = boto3.client(
-        service_name="bedrock-runtime", 
-        region_name=aws_region
-    )
-
-    prompt = f"""
-    You are a senior product manager. 
-    Your task is to generate a clear, concise, and professional GitHub issue title. 
-    The title should summarize the content of the issue in one short sentence. 
-    Do not return anything except the title itself (no description, no formatting).  
-    
-    Input: {issue_content}
-    """
-
-    request_body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4096,
-        "messages": [
-            {
-                "role": "user",
-                "content": [{"type": "text", "text": prompt}],
-            }
-        ],
-    }
+    messages = [
+        {
+            "role": "user",
+            "content": [{"text": prompt}],
+        },
+        {
+            "role": "assistant",
+            "content": [{"text": "{"}],
+        }
+    ]
 
     try:
-        response = bedrock_runtime_client.invoke_model(
+        response = bedrock_runtime_client.converse(
             modelId=model_id,
-            body=json.dumps(request_body),
+            messages=messages,
+            inferenceConfig={"maxTokens": ISSUE_MAX_TOKENS},
         )
 
-        response_body = json.loads(response.get("body").read())
-        
-        model_commentary = response_body["content"][0]["text"]
-        return model_commentary
+        # The assistant turn is prefilled with "{" so the model cannot drift into prose before the JSON
+        model_commentary = "{" + response["output"]["message"]["content"][0]["text"]
+        # strict=False accepts the raw newlines the model leaves inside the Markdown body string
+        issue = json.loads(model_commentary, strict=False)
+        return {
+            'title': issue['title'],
+            'body': issue['body']
+        }
 
     except Exception as e:
-        print(f"Erreur lors de l'appel à Bedrock : {e}")
+        logger.error(f"Erreur lors de l'appel à Bedrock : {e}")
 
 def lambda_handler(event, context):
     body = json.loads(event['body'])
@@ -100,11 +71,14 @@ def lambda_handler(event, context):
             'body': "not found"
         }
 
-    issue_body = issue_writer(body['content'])
+    issue = issue_writer(body['content'])
+    if issue is None:
+        return {
+            'statusCode': 500,
+            'body': json.dumps({'error': "issue generation failed"})
+        }
+
     return {
         'statusCode': 200,
-        'body': {
-            'title': issue_title_generator(issue_body), 
-            'body': issue_body
-        }
+        'body': issue
     }
@@ -0,0 +1,183 @@
+import json
+import logging
+import os
+import boto3
+from botocore.config import Config
+
+# Debug records, like the size of each file read from S3, only reach CloudWatch when LOG_LEVEL=DEBUG
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+s3_bucket_name = "simpleflowdata"
+
+# Built once per container: warm invocations reuse the clients and their keep-alive connection to Bedrock
+s3_client = boto3.client("s3")
+bedrock_runtime_client = boto3.client(
+    service_name="bedrock-runtime",
+    region_name="eu-west-3",
+    config=Config(tcp_keepalive=True, retries={"max_attempts": 2})
+)
+
+# One entry per task served by this function. "input" is the request body field holding the content,
+# "from_s3" means that field is a key in the S3 bucket whose file content is sent to the model between
+# "prompt_prefix" and the optional "prompt_suffix". "to_s3" writes the output back to the bucket and only returns its key.
+# "max_tokens" is sized to the task: Bedrock reserves KV for the requested budget, only "doc" returns a whole file.
+PROMPTS = {
+    "doc": {
+        "model_id": "anthropic.claude-3-haiku-20240307-v1:0",
+        "max_tokens": 4096,
+        "input": "file_id",
+        "from_s3": True,
+        "to_s3": True,
+        "prompt_prefix": """
+    You are a senior software engineer at Amazon. Your task is to add inline documentation.
+
+    Return the original file content with inline comments added. The comments should:
+
+    Explain the role of each function and major code block.
+
+    Clarify important logic decisions and exception handling.
+
+    Be concise, technical, and helpful for future developers reading the code.
+
+    Tone: professional, technical, and developer-oriented.
+    Output: Return only the fully commented code. Do not wrap the response in Markdown, do not add triple backticks, and do not include any additional text. The response must be plain code only.
+    File content:
+    """,
+    },
+    "pr_summary": {
+        "model_id": "eu.amazon.nova-lite-v1:0",
+        "max_tokens": 2048,
+        "input": "file_id",
+        "from_s3": True,
+        "prompt_prefix": """
+    Act as a senior software engineer at Amazon, tasked with writing a concise yet comprehensive summary for a pull request description. Your goal is to help reviewers quickly understand the purpose, design, and impact of the code.
+
+    Based on the file content below, generate a summary in Markdown format that includes:
+    1.  **High-Level Purpose:** A brief, one-sentence explanation of the file's primary role.
+    2.  **Implementation Details:** A bulleted list outlining the key components (classes, functions), their responsibilities, and any important logic or algorithms used.
+    3.  **Context & Usage:** A short note on how this code is expected to be used or what other parts of the system it interacts with.
+
+    The tone should be professional and technical. The output should be ready to be copy-pasted directly into a GitHub pull request body.
+    ---
+    """,
+        "prompt_suffix": """
+    ---
+    """,
+    },
+    "pr_label": {
+        "model_id": "eu.amazon.nova-lite-v1:0",
+        "max_tokens": 1024,
+        "input": "summaries",
+        "from_s3": False,
+        "prompt_prefix": """
+    Act as a senior software engineer, tasked with writing a concise yet comprehensive summary for a pull request description. Your goal is to help reviewers quickly understand the purpose, design, and impact of the changes across multiple files.
+
+    Based on the file changes below, generate a summary in Markdown format. The input is a stringified dictionary where each key is a file name and each value is a brief summary of the changes in that file. Your summary must synthesize these individual changes into a coherent pull request description that includes:
+
+    1.  **High-Level Purpose:** A brief, one-sentence explanation of the overall goal of the pull request. For example: "This PR introduces a new feature for user authentication."
+    2.  **Implementation Details:** A bulleted list outlining the key changes made in each file. Use the provided summaries to create a cohesive narrative.
+    3.  **Context & Usage:** A short note on how these changes fit into the broader system and any important new interactions, configurations, or dependencies.
+
+    The tone should be professional and technical. The output should be ready to be copy-pasted directly into a GitHub pull request body.
+    ---
+    """,
+        "prompt_suffix": """
+    ---
+    """,
+    },
+}
+
+# API Gateway routes integrated with this function, used when the request body does not name its task
+ROUTES = {
+    "/doc/writer": "doc",
+    "/pr/summarizer": "pr_summary",
+    "/pr/labeler": "pr_label",
+}
+
+def read_s3_file(key):
+    s3_object = s3_client.get_object(Bucket=s3_bucket_name, Key=key)
+    file_bytes = bytearray()
+    for chunk in s3_object["Body"].iter_chunks(65536):
+        file_bytes.extend(chunk)
+    return file_bytes.decode("utf-8")
+
+def write_s3_file(key, content):
+    s3_client.put_object(Bucket=s3_bucket_name, Key=key, Body=content.encode("utf-8"), ContentType="text/plain")
+
+def prompt_generator(task, content):
+    task_config = PROMPTS[task]
+
+    # Separate text blocks of one message: a multi-MB file is never copied into a concatenated prompt string
+    prompt_parts = [{"text": task_config["prompt_prefix"]}]
+    # Converse rejects blank text blocks, an empty file leaves the prompt without a content block
+    if content.strip():
+        prompt_parts.append({"text": content})
+    if "prompt_suffix" in task_config:
+        prompt_parts.append({"text": task_config["prompt_suffix"]})
+
+    messages = [
+        {
+            "role": "user",
+            "content": prompt_parts,
+        }
+    ]
+
+    response = bedrock_runtime_client.converse(
+        modelId=task_config["model_id"],
+        messages=messages,
+        inferenceConfig={"maxTokens": task_config["max_tokens"]},
+    )
+
+    return response["output"]["message"]["content"][0]["text"]
+
+def lambda_handler(event, context):
+    body = json.loads(event['body'])
+    task = body.get("task", ROUTES.get(event.get("resource")))
+    if task not in PROMPTS or PROMPTS[task]["input"] not in body:
+        return {
+            'statusCode': 404,
+            'body': "not found"
+        }
+
+    content = body[PROMPTS[task]["input"]]
+    if PROMPTS[task]["from_s3"]:
+        try:
+            content = read_s3_file(content)
+            logger.debug("file read from S3: %d chars", len(content))
+        except Exception as e:
+            # Answer with an error instead of exiting, so the warm container and its clients serve the next request
+            logger.error(f"An error occured when reading S3 file : {e}")
+            return {
+                'statusCode': 500,
+                'body': json.dumps({"error": str(e)})
+            }
+
+    try:
+        model_commentary = prompt_generator(task, content)
+    except Exception as e:
+        logger.error(f"Erreur lors de l'appel à Bedrock : {e}")
+        return {
+            'statusCode': 500,
+            'body': json.dumps({"error": str(e)})
+        }
+
+    if PROMPTS[task].get("to_s3"):
+        # Output as large as the input file: keep it out of the API Gateway response, the caller fetches it from S3
+        out_key = f"outputs/{body[PROMPTS[task]['input']]}-{task}.txt"
+        try:
+            write_s3_file(out_key, model_commentary)
+        except Exception as e:
+            logger.error(f"An error occured when writing S3 file : {e}")
+            return {
+                'statusCode': 500,
+                'body': json.dumps({"error": str(e)})
+            }
+        return {
+            'statusCode': 200,
+            'body': json.dumps({"key": out_key})
+        }
+    return {
+        'statusCode': 200,
+        'body': model_commentary
+    }